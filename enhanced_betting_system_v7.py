@@ -14,29 +14,49 @@ Features:
 - Auto-logging bets
 """
 
-import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import io
+import csv
 import sys
+import math
+import json
+import time
+import hashlib
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List
-from scipy import stats
+from functools import lru_cache
+from scipy.special import ndtr
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-MAPPER = None
-try:
-    from team_mapping import TeamMapper
-    MAPPER = TeamMapper()
-except: pass
+# TeamMapper / PlayerProjections build their tables on construction, so they are
+# created on first use (None = not tried yet, False = unavailable)
+_MAPPER = None
+def _get_mapper():
+    global _MAPPER
+    if _MAPPER is None:
+        _MAPPER = False
+        try:
+            from team_mapping import TeamMapper
+            _MAPPER = TeamMapper()
+        except: pass
+    return _MAPPER or None
 
-PLAYER_PROJ = None
-try:
-    from player_projections import PlayerProjections
-    PLAYER_PROJ = PlayerProjections()
-except: pass
+_PP = None
+def _get_player_proj():
+    global _PP
+    if _PP is None:
+        _PP = False
+        try:
+            from player_projections import PlayerProjections
+            _PP = PlayerProjections()
+        except: pass
+    return _PP or None
 
 HAS_MINUTES = False
 try:
@@ -68,6 +88,19 @@ try:
     HAS_REST = True
 except: pass
 
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except: pass
+
+HAS_NUMBA = False
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except:
+    def njit(*args,**kwargs): return lambda f: f
+
 SPREAD_STD = 11.0
 KELLY_FRAC = 0.15
 MIN_EDGE = 2.0
@@ -75,36 +108,104 @@ MIN_COVER = 0.52
 MAX_BETS = 5
 BANKROLL = 10000.0
 MIN_HOURS_UNTIL_GAME = 1.5
+ODDS_CACHE_DIR = os.path.expanduser("~/.cache/cbb_odds")
+ODDS_CACHE_TTL = 15*60
+
+# Shared keep-alive session: repeated API calls reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 CONFERENCE_HCA = {'B12':4.0,'B10':4.0,'SEC':4.0,'ACC':3.8,'BE':3.8,'MWC':3.8,'WCC':3.5,'A10':3.5,'default':3.5}
 ELITE_VENUES = {'Duke':1.2,'Kansas':1.2,'Kentucky':1.0,'Gonzaga':1.0,'Purdue':1.0,'Auburn':1.0}
 
+# Per-game kernels, JIT-compiled when numba is available
+@njit(cache=True,fastmath=True)
+def _margin(ho,hd,ht,ao,ad,at,hca,adj_total):
+    """Projected home margin for one game."""
+    pace=(ht*at)/67.5
+    h_eff=(ho*ad)/100
+    a_eff=(ao*hd)/100
+    return ((h_eff*pace)/100+hca/2)-((a_eff*pace)/100-hca/2)+adj_total
+
+@njit(cache=True,fastmath=True)
+def _cover_kelly(h_margin,mkt_spread,spread_std,kelly_frac,min_cover):
+    """Bet side (+1 home/-1 away), cover prob and unscaled kelly for one game."""
+    side=2.0*(-h_margin<mkt_spread)-1.0
+    cover=0.5*math.erfc(-side*(h_margin+mkt_spread)/(spread_std*math.sqrt(2.0)))
+    kelly=max(0.0,((0.909*cover)-(1-cover))/0.909*kelly_frac) if cover>min_cover else 0.0
+    return side,cover,kelly
+
+@lru_cache(maxsize=2048)
+def map_team(name):
+    """Odds API team name -> Barttorvik name (memoized; a slate repeats the same teams)."""
+    mapper = _get_mapper()
+    return mapper.odds_to_barttorvik(name) if mapper else name
+
+def _json_loads(raw): return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+def _med_sorted(s):
+    """Median of an already-sorted short list (avoids np.median's array round-trip)."""
+    n=len(s)
+    return float(s[n//2]) if n&1 else (s[n//2-1]+s[n//2])/2
+
 class TeamLoader:
     def __init__(self):
         self.path = os.path.expanduser("~/cbb_betting/barttorvik_2026.csv")
         self.teams = {}
+        self.idx = {}
     def load(self):
         if not os.path.exists(self.path): return False
-        df = pd.read_csv(self.path)
-        for _,r in df.iterrows():
-            n = r['team']
-            self.teams[n.lower()] = {'team':n,'rank':int(r['rank']),'conf':r['conf'],'adj_o':float(r['adjoe']),'adj_d':float(r['adjde']),'adj_t':float(r['adjt'])}
+        with open(self.path, newline='') as f:
+            recs = [{'team':sys.intern(r['team']),'rank':int(r['rank']),'conf':r['conf'],'adj_o':float(r['adjoe']),'adj_d':float(r['adjde']),'adj_t':float(r['adjt'])}
+                    for r in csv.DictReader(f)]  # interned: identity-equal names for ELITE_VENUES / adjuster lookups
+        self.teams = {r['team'].lower():r for r in recs}
+        # Column arrays + name->row map used by the predictor (get() keeps the dicts for add-on modules)
+        self.idx = {r['team'].lower():i for i,r in enumerate(recs)}
+        self.team_name = np.array([r['team'] for r in recs],dtype=object)
+        self.rank = np.array([r['rank'] for r in recs],dtype=np.int32)
+        self.conf = np.array([r['conf'] for r in recs],dtype=object)
+        self.adj_o = np.array([r['adj_o'] for r in recs],dtype=np.float64)
+        self.adj_d = np.array([r['adj_d'] for r in recs],dtype=np.float64)
+        self.adj_t = np.array([r['adj_t'] for r in recs],dtype=np.float64)
+        self.hca = np.array([CONFERENCE_HCA.get(r['conf'],3.5) for r in recs],dtype=np.float64)
+        self.venue_bonus = np.array([ELITE_VENUES.get(r['team'],0.0) for r in recs],dtype=np.float64)
         print(f"  ✓ {len(self.teams)} teams")
         return True
     def get(self,name): return self.teams.get(name.lower().strip())
+    def index(self,name): return self.idx.get(name.lower().strip(),-1)
 
 class OddsAPI:
-    def __init__(self,key):
+    def __init__(self,key,cache='auto',session=None):
         self.key = key
+        self.sess = session or _SESSION
+        self.cache = cache  # auto: reuse <15min old | replay: cache only | off: always hit the API
         self.games = []
+    def _cache_path(self):
+        key = hashlib.sha256(f"ncaab|spreads|{datetime.now(timezone.utc):%Y%m%d%H}".encode()).hexdigest()
+        return os.path.join(ODDS_CACHE_DIR, f"{key}.json")
+    def _load(self):
+        path = self._cache_path()
+        if self.cache != 'off' and os.path.exists(path):
+            if self.cache == 'replay' or time.time()-os.path.getmtime(path) < ODDS_CACHE_TTL:
+                with open(path,'rb') as f: return _json_loads(f.read())
+        if self.cache == 'replay':
+            print(f"  ✗ No cached odds for this hour ({path})")
+            return None
+        r = self.sess.get("https://api.the-odds-api.com/v4/sports/basketball_ncaab/odds",params={'apiKey':self.key,'regions':'us','markets':'spreads'},timeout=30)
+        if r.status_code != 200: return None
+        data = _json_loads(r.content)
+        if self.cache != 'off':
+            os.makedirs(ODDS_CACHE_DIR, exist_ok=True)
+            with open(path, 'wb') as f: f.write(r.content)
+        return data
     def fetch(self):
-        r = requests.get("https://api.the-odds-api.com/v4/sports/basketball_ncaab/odds",params={'apiKey':self.key,'regions':'us','markets':'spreads'},timeout=30)
-        if r.status_code != 200: return False
+        data = self._load()
+        if data is None: return False
         
         now = datetime.now(timezone.utc)
         skipped_live = 0
         
-        for g in r.json():
+        for g in data:
             commence = g.get('commence_time', '')
             game_hour_et = 19
             
@@ -122,18 +223,13 @@ class OddsAPI:
                     pass
             
             h,a = g.get('home_team',''),g.get('away_team','')
-            hm = MAPPER.odds_to_barttorvik(h) if MAPPER else h
-            am = MAPPER.odds_to_barttorvik(a) if MAPPER else a
-            spreads = []
-            for b in g.get('bookmakers',[]):
-                for m in b.get('markets',[]):
-                    if m['key']=='spreads':
-                        for o in m['outcomes']:
-                            if o['name']==h: spreads.append(o.get('point',0))
-            if spreads and max(spreads)-min(spreads)<=5:
+            hm,am = map_team(h),map_team(a)
+            spreads = sorted(o.get('point',0) for b in g.get('bookmakers',()) for m in b.get('markets',()) if m.get('key')=='spreads'
+                             for o in m.get('outcomes',()) if o.get('name')==h)
+            if spreads and spreads[-1]-spreads[0]<=5:
                 self.games.append({
                     'home':hm,'away':am,
-                    'spread':round(np.median(spreads),1),
+                    'spread':round(_med_sorted(spreads),1),
                     'game_hour_et': game_hour_et
                 })
         
@@ -166,82 +262,163 @@ class PredictorV7:
         if HAS_MATCHUP:
             self.matchups = MatchupAnalyzer(loader)
     
-    def predict(self,home_name,away_name,mkt_spread,game_hour_et=19,bankroll=10000):
-        home=self.loader.get(home_name); away=self.loader.get(away_name)
-        if not home or not away: return None
-        factors=[]
-        
-        pace=(home['adj_t']*away['adj_t'])/67.5
-        h_eff=(home['adj_o']*away['adj_d'])/100
-        a_eff=(away['adj_o']*home['adj_d'])/100
-        hca=CONFERENCE_HCA.get(home['conf'],3.5)
-        h_pts=(h_eff*pace)/100+hca/2
-        a_pts=(a_eff*pace)/100-hca/2
-        h_margin=h_pts-a_pts
-        
-        if home['team'] in ELITE_VENUES:
-            h_margin+=ELITE_VENUES[home['team']]
-            factors.append(f"Elite venue +{ELITE_VENUES[home['team']]}")
+    def precompute_adjustments(self,games):
+        """Injury/rest/matchup/travel deltas (home POV) for a slate: one length-N array per source plus per-game factor lines.
+        Each adjuster runs once across all games; unknown teams get 0 and no factors."""
+        L=self.loader; n=len(games)
+        teams=[]
+        for g in games:
+            hi,ai=L.index(g['home']),L.index(g['away'])
+            teams.append((L.team_name[hi],L.team_name[ai]) if hi>=0 and ai>=0 else None)
+        deltas={k:np.zeros(n) for k in ('inj','rest','matchup','travel')}
+        factors=[[] for _ in range(n)]
         
         if self.enhanced_inj:
-            hi,hp=self.enhanced_inj.get_injury_impact(home['team'])
-            ai,ap=self.enhanced_inj.get_injury_impact(away['team'])
-            adj=(ai-hi)*0.7
-            if abs(adj)>0.5:
-                h_margin+=adj
-                if hi>1: 
-                    factors.append(f"{home['team']} injuries: -{hi:.1f}")
-                    for p in hp[:2]: factors.append(f"  └ {p}")
-                if ai>1: 
-                    factors.append(f"{away['team']} injuries: -{ai:.1f}")
-                    for p in ap[:2]: factors.append(f"  └ {p}")
+            impact={}  # one lookup per team even if it appears in several games
+            for i,t in enumerate(teams):
+                if not t: continue
+                home,away=t
+                for team in t:
+                    if team not in impact: impact[team]=self.enhanced_inj.get_injury_impact(team)
+                (hi,hp),(ai,ap)=impact[home],impact[away]
+                iadj=(ai-hi)*0.7
+                if abs(iadj)>0.5:
+                    deltas['inj'][i]=iadj
+                    if hi>1:
+                        factors[i].append(f"{home} injuries: -{hi:.1f}")
+                        for p in hp[:2]: factors[i].append(f"  └ {p}")
+                    if ai>1:
+                        factors[i].append(f"{away} injuries: -{ai:.1f}")
+                        for p in ap[:2]: factors[i].append(f"  └ {p}")
         
         if self.rest:
-            radj,reason=self.rest.get_rest_adjustment(home['team'],away['team'])
-            if abs(radj)>0.3: 
-                h_margin+=radj
-                if reason: factors.append(reason)
+            for i,t in enumerate(teams):
+                if not t: continue
+                radj,reason=self.rest.get_rest_adjustment(*t)
+                if abs(radj)>0.3:
+                    deltas['rest'][i]=radj
+                    if reason: factors[i].append(reason)
         
         if self.matchups:
-            madj,mfactors=self.matchups.get_all_adjustments(home['team'],away['team'])
-            if abs(madj)>0.3:
-                h_margin+=madj
-                for mf in mfactors: factors.append(mf)
+            for i,t in enumerate(teams):
+                if not t: continue
+                madj,mfactors=self.matchups.get_all_adjustments(*t)
+                if abs(madj)>0.3:
+                    deltas['matchup'][i]=madj
+                    factors[i].extend(mfactors)
         
         if HAS_TRAVEL:
-            tadj,treason=get_travel_adjustment(home['team'],away['team'],game_hour_et)
-            if abs(tadj)>0.3:
-                h_margin+=tadj
-                if treason: factors.append(treason)
-        
-        mdl=-h_margin
-        winner=home['team'] if h_margin>0 else away['team']
-        margin_abs=abs(h_margin)
-        edge=abs(mkt_spread-mdl)
-        
-        if mdl<mkt_spread: bet_team,bet_line=home['team'],mkt_spread
-        else: bet_team,bet_line=away['team'],-mkt_spread
+            for i,(t,g) in enumerate(zip(teams,games)):
+                if not t: continue
+                tadj,treason=get_travel_adjustment(*t,g.get('game_hour_et',19))
+                if abs(tadj)>0.3:
+                    deltas['travel'][i]=tadj
+                    if treason: factors[i].append(treason)
         
-        exp,mkt=-mdl,-mkt_spread
-        cover=1-stats.norm.cdf(mkt,exp,SPREAD_STD) if bet_team==home['team'] else stats.norm.cdf(mkt,exp,SPREAD_STD)
-        
-        kelly_mult=1.0
+        return deltas,factors
+    
+    def _line_kelly(self,home_name,away_name,home_side):
+        """Kelly multiplier from line movement relative to the side we bet."""
+        kelly_mult=1.0; factors=[]
         if self.line_tracker:
             game_key=f"{away_name} @ {home_name}"
             movement=self.line_tracker.get_line_movement(game_key)
             if movement and abs(movement.get('movement',0))>1:
                 move=movement['movement']
-                your_side='home' if bet_team==home['team'] else 'away'
+                your_side='home' if home_side else 'away'
                 if (your_side=='home' and move<-1) or (your_side=='away' and move>1):
                     kelly_mult=1.15; factors.append(f"Sharp $ your way ({move:+.1f}) ↑")
                 elif (your_side=='home' and move>1) or (your_side=='away' and move<-1):
                     kelly_mult=0.85; factors.append(f"Line moving against ({move:+.1f}) ↓")
+        return kelly_mult,factors
+    
+    def predict(self,home_name,away_name,mkt_spread,game_hour_et=19,bankroll=10000,return_all=False):
+        """None for unknown teams, or (unless return_all) when the edge is below MIN_EDGE."""
+        L=self.loader
+        hi=L.index(home_name); ai=L.index(away_name)
+        if hi<0 or ai<0: return None
+        home,away=L.team_name[hi],L.team_name[ai]
+        factors=[]
+        
+        hca=L.hca[hi]
+        venue=L.venue_bonus[hi]
+        if venue: factors.append(f"Elite venue +{venue}")
+        
+        deltas,afactors=self.precompute_adjustments([{'home':home_name,'away':away_name,'game_hour_et':game_hour_et}])
+        adj=float(sum(d[0] for d in deltas.values())); factors+=afactors[0]
+        
+        h_margin=_margin(L.adj_o[hi],L.adj_d[hi],L.adj_t[hi],L.adj_o[ai],L.adj_d[ai],L.adj_t[ai],hca,venue+adj)
+        mdl=-h_margin
+        edge=abs(mkt_spread-mdl)
+        if round(edge,1)<MIN_EDGE and not return_all: return None
+        
+        side,cover,kelly=_cover_kelly(h_margin,mkt_spread,SPREAD_STD,KELLY_FRAC,MIN_COVER)
+        winner=home if h_margin>0 else away
+        margin_abs=abs(h_margin)
+        
+        bet_team=home if side>0 else away
+        bet_line=side*mkt_spread
         
-        kelly=max(0,((0.909*cover)-(1-cover))/0.909*KELLY_FRAC)*kelly_mult if cover>MIN_COVER else 0
+        kelly_mult,lfactors=self._line_kelly(home_name,away_name,side>0)
+        factors+=lfactors
+        
+        kelly*=kelly_mult
         stake=min(bankroll*kelly,bankroll*0.03,bankroll*0.10)
         stake=round(stake/5)*5
         
-        return Pred(home['team'],away['team'],home['rank'],away['rank'],mkt_spread,round(mdl,1),round(edge,1),bet_team,round(bet_line,1),round(cover,4),round(kelly,4),stake,winner,round(margin_abs,1),factors)
+        return Pred(home,away,int(L.rank[hi]),int(L.rank[ai]),mkt_spread,round(mdl,1),round(edge,1),bet_team,round(bet_line,1),round(cover,4),round(kelly,4),stake,winner,round(margin_abs,1),factors)
+    
+    def predict_batch(self,games,bankroll=10000,adjustments=None,return_all=False):
+        """predict() over a whole slate: margin/cover/kelly in one NumPy pass instead of per game.
+        adjustments: optional precompute_adjustments(games) result to reuse. Games below MIN_EDGE
+        are dropped before the cover/kelly math unless return_all."""
+        L=self.loader; n=len(games)
+        deltas,afactors=adjustments or self.precompute_adjustments(games)
+        hi=np.fromiter((L.index(g['home']) for g in games),np.intp,n)
+        ai=np.fromiter((L.index(g['away']) for g in games),np.intp,n)
+        keep=np.flatnonzero((hi>=0)&(ai>=0))
+        if not len(keep): return []
+        games=[games[k] for k in keep]; hi=hi[keep]; ai=ai[keep]; n=len(games)
+        adj=(deltas['inj']+deltas['rest']+deltas['matchup']+deltas['travel'])[keep]
+        afactors=[afactors[k] for k in keep]
+        homes=L.team_name[hi].tolist(); aways=L.team_name[ai].tolist()
+        h_rank=L.rank[hi].tolist(); a_rank=L.rank[ai].tolist()
+        
+        mkt_spread=np.fromiter((g['spread'] for g in games),np.float64,n)
+        hca=L.hca[hi]
+        venue=L.venue_bonus[hi]
+        
+        pace=(L.adj_t[hi]*L.adj_t[ai])/67.5
+        h_eff=(L.adj_o[hi]*L.adj_d[ai])/100
+        a_eff=(L.adj_o[ai]*L.adj_d[hi])/100
+        h_margin=((h_eff*pace)/100+hca/2)-((a_eff*pace)/100-hca/2)+venue+adj
+        
+        mdl=-h_margin
+        edge=np.abs(mkt_spread-mdl)
+        # Same rounded test main() filters on, so no qualifying game is dropped here
+        sel=np.arange(n) if return_all else np.flatnonzero([round(e,1)>=MIN_EDGE for e in edge.tolist()])
+        h_margin,mkt_spread=h_margin[sel],mkt_spread[sel]
+        side=np.where(-h_margin<mkt_spread,1.0,-1.0)
+        bet_line=side*mkt_spread
+        cover=ndtr(side*(h_margin+mkt_spread)/SPREAD_STD)
+        kelly=np.where(cover>MIN_COVER,np.maximum(0,((0.909*cover)-(1-cover))/0.909*KELLY_FRAC),0.0)
+        
+        preds=[]
+        for j,i in enumerate(sel.tolist()):
+            g,home,away=games[i],homes[i],aways[i]
+            factors=[f"Elite venue +{venue[i]}"] if venue[i] else []
+            factors+=afactors[i]
+            hs=side[j]>0
+            kelly_mult,lfactors=self._line_kelly(g['home'],g['away'],hs)
+            factors+=lfactors
+            k=float(kelly[j])*kelly_mult
+            stake=min(bankroll*k,bankroll*0.03,bankroll*0.10)
+            stake=round(stake/5)*5
+            hm=float(h_margin[j])
+            preds.append(Pred(home,away,h_rank[i],a_rank[i],g['spread'],round(-hm,1),round(float(edge[i]),1),
+                              home if hs else away,round(float(bet_line[j]),1),round(float(cover[j]),4),round(k,4),stake,
+                              home if hm>0 else away,round(abs(hm),1),factors))
+        return preds
 
 def auto_log_bets(bets):
     """Automatically append today's bets to bet_log.csv"""
@@ -252,16 +429,18 @@ def auto_log_bets(bets):
         with open(log_path, 'w') as f:
             f.write("date,game,bet,line,stake,edge,cover_prob,result,profit\n")
     
-    with open(log_path, 'r') as f:
-        content = f.read()
-        if today in content:
+    # Log is append-only in date order, so today's rows (if any) are at the tail
+    with open(log_path, 'rb') as f:
+        f.seek(max(0, os.path.getsize(log_path)-4096))
+        if today in f.read().decode(errors='ignore'):
             print(f"\n⚠ Today's bets already in log - skipping auto-log")
             return
     
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator='\n').writerows(
+        [today, f"{b.away} @ {b.home}", b.bet_team, b.bet_line, b.stake, b.edge, f"{b.cover*100:.1f}", '', ''] for b in bets)
     with open(log_path, 'a') as f:
-        for b in bets:
-            game = f"{b.away} @ {b.home}"
-            f.write(f"{today},{game},{b.bet_team},{b.bet_line},{b.stake},{b.edge},{b.cover*100:.1f},,\n")
+        f.write(buf.getvalue())
     
     print(f"\n✓ Auto-logged {len(bets)} bets to bet_log.csv")
 
@@ -271,8 +450,10 @@ def main():
     p.add_argument('--odds-key',required=True)
     p.add_argument('--bankroll',type=float,default=10000)
     p.add_argument('--no-log',action='store_true',help='Skip auto-logging')
+    p.add_argument('--odds-cache',choices=['auto','replay','off'],default='auto',help='Odds response cache: auto (reuse <15min), replay (cache only), off')
     args=p.parse_args()
     global BANKROLL; BANKROLL=args.bankroll
+    player_proj=_get_player_proj(); _get_mapper()
     
     print("\n"+"="*80)
     print("CBB BETTING SYNDICATE v7.2")
@@ -285,34 +466,38 @@ def main():
     loader=TeamLoader()
     if not loader.load(): return
     
-    print("\n[2] Loading player BPM...")
-    if PLAYER_PROJ: PLAYER_PROJ.fetch_all_players()
-    
-    print("\n[3] Loading injuries...")
-    inj=None
-    if HAS_INJURIES: inj=InjuryLoader(); inj.load()
-    
-    print("\n[4] Loading rest data...")
-    rest=None
-    if HAS_REST: rest=RestTrackerV2(); rest.fetch_recent_games(5)
-    
-    print("\n[5] Loading line movement...")
-    line_tracker=None
-    try:
-        from line_movement import LineMovementTracker
-        line_tracker=LineMovementTracker(args.odds_key)
-        line_tracker.fetch_current_lines()
-        print(f"  ✓ Tracking {len(line_tracker.line_history)} games")
-    except: print("  ✗ Line tracking unavailable")
-    
-    print("\n[6] Fetching odds (pre-game only)...")
-    api=OddsAPI(args.odds_key)
-    if not api.fetch(): return
+    # [2]-[6] are independent network/disk loads -> run them concurrently
+    print("\n[2-6] Loading player BPM, injuries, rest data, line movement, odds (pre-game only)...")
+    def load_injuries():
+        inj=InjuryLoader(); inj.load(); return inj
+    def load_rest():
+        rest=RestTrackerV2(); rest.fetch_recent_games(5); return rest
+    def load_lines():
+        try:
+            from line_movement import LineMovementTracker
+            line_tracker=LineMovementTracker(args.odds_key)
+            line_tracker.fetch_current_lines()
+            return line_tracker
+        except: return None
+    api=OddsAPI(args.odds_key,args.odds_cache)
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        fut_players=ex.submit(player_proj.fetch_all_players) if player_proj else None
+        fut_inj=ex.submit(load_injuries) if HAS_INJURIES else None
+        fut_rest=ex.submit(load_rest) if HAS_REST else None
+        fut_lines=ex.submit(load_lines)
+        fut_odds=ex.submit(api.fetch)
+        if fut_players: fut_players.result()
+        inj=fut_inj.result() if fut_inj else None
+        rest=fut_rest.result() if fut_rest else None
+        line_tracker=fut_lines.result()
+        odds_ok=fut_odds.result()
+    if line_tracker: print(f"  ✓ Tracking {len(line_tracker.line_history)} games")
+    else: print("  ✗ Line tracking unavailable")
+    if not odds_ok: return
     
     print("\n[7] Generating predictions...")
-    pred=PredictorV7(loader,inj,rest,PLAYER_PROJ,line_tracker)
-    preds=[pred.predict(g['home'],g['away'],g['spread'],g.get('game_hour_et',19),BANKROLL) for g in api.games]
-    preds=[x for x in preds if x]
+    pred=PredictorV7(loader,inj,rest,player_proj,line_tracker)
+    preds=pred.predict_batch(api.games,BANKROLL)
     preds.sort(key=lambda x:x.edge,reverse=True)
     bets=[x for x in preds if x.edge>=MIN_EDGE and x.cover>=MIN_COVER and x.stake>=20][:MAX_BETS]
     
@@ -322,7 +507,8 @@ def main():
     
     if not bets:
         print("\n  NO QUALIFYING BETS TODAY")
-        print(f"\n  Analyzed: {len(preds)} games")
+        analyzed=sum(1 for g in api.games if loader.index(g['home'])>=0 and loader.index(g['away'])>=0)
+        print(f"\n  Analyzed: {analyzed} games")
         print(f"  With 2+ edge: {len([p for p in preds if p.edge >= 2])}")
         return
     